@@ -29,14 +29,13 @@ def verify_serial(serial_number):
 
 def lambda_handler(event, context):
     response = {'allowProvisioning': False}
-    logger.info("event: {}".format(json.dumps(event, indent=2)))
+    logger.info("event: {}".format(json.dumps(event, separators=(',', ':'))))
 
-    if not "SerialNumber" in event["parameters"]:
+    serial_number = event["parameters"].get("SerialNumber")
+    if serial_number is None:
         logger.error("SerialNumber not provided")
-    else:
-        serial_number = event["parameters"]["SerialNumber"]
-        if verify_serial(serial_number):
-            response = {'allowProvisioning': True}
+    elif verify_serial(serial_number):
+        response = {'allowProvisioning': True}
     
     logger.info("response: {}".format(response))
     return response